@@ -11,6 +11,7 @@ import sys
 import os
 import platform
 import importlib
+from functools import lru_cache
 from importlib.metadata import entry_points
 from typing import Optional, Tuple, List, Dict
 
@@ -27,6 +28,22 @@ app = typer.Typer(
 # Initialize a default console for use outside of the main CLI flow
 console = Console()
 
+# Built-in commands: (name, module_path, object_name, is_module)
+_BUILTIN_COMMANDS = (
+    ("analyze", "src.cli.analyze.main", "app", False),
+    ("test", "src.cli.test.hook", "app", False),
+    ("validate", "src.cli.validate.main", "app", False),
+    ("artifact", "src.cli.artifact.main", "app", False),
+    ("preflight", "src.cli.artifact.preflight", "app", False),
+    ("adapter", "src.cli.artifact.adapter", None, True),  # Import as module
+    ("install", "src.cli.install.main", "app", False),
+    ("model", "src.cli.model.main", "app", False),
+    ("benchmark", "src.cli.benchmark.main", "app", False),
+)
+
+# Commands pre-loaded eagerly so they work even if discovery fails
+_CRITICAL_COMMANDS = frozenset({"analyze", "model"})
+
 def setup_logging(verbose: bool = False, quiet: bool = False, json_logs: bool = False, log_file: Optional[str] = None, 
                no_color: bool = False, ci: bool = False) -> Tuple[Console, logging.Logger]:
     """
@@ -100,25 +117,26 @@ def setup_logging(verbose: bool = False, quiet: bool = False, json_logs: bool =
     
     return configured_console, logger
 
+@lru_cache(maxsize=None)
+def _entry_points(group: str):
+    """
+    Return the entry points registered under a group, scanning installed
+    distributions only once per process.
+    
+    Args:
+        group: Entry point group name, e.g. 'fa.commands'
+        
+    Returns:
+        The entry points selected for the group
+    """
+    return entry_points(group=group)
+
 def load_commands():
     """
     Discover and load commands registered under 'fa.commands' entry point.
     """
     logger = logging.getLogger("file-analyzer")
     
-    # Define command mapping: name -> (module_path, object_name, is_module)
-    command_mapping = {
-        'analyze': ('src.cli.analyze.main', 'app', False),
-        'test': ('src.cli.test.hook', 'app', False),
-        'validate': ('src.cli.validate.main', 'app', False),
-        'artifact': ('src.cli.artifact.main', 'app', False),
-        'preflight': ('src.cli.artifact.preflight', 'app', False),
-        'adapter': ('src.cli.artifact.adapter', None, True),
-        'install': ('src.cli.install.main', 'app', False),
-        'model': ('src.cli.model.main', 'app', False),
-        'benchmark': ('src.cli.benchmark.main', 'app', False),
-    }
-    
     # Always directly import the critical commands first to ensure they work
     try:
         # Pre-load analyze command
@@ -137,7 +155,7 @@ def load_commands():
     
     try:
         # Discover entry points
-        discovered_commands = entry_points(group='fa.commands')
+        discovered_commands = _entry_points('fa.commands')
         
         # Log discovered commands
         logger.debug(f"Found entry points: {list(discovered_commands)}")
@@ -146,12 +164,9 @@ def load_commands():
         entry_map = {entry.name: entry for entry in discovered_commands}
         
         # Register commands that are in the entry points, skip analyze and model as they're already loaded
-        for cmd_name, config in command_mapping.items():
-            if cmd_name in entry_map and cmd_name not in ['analyze', 'model']:
-                if len(config) == 2:
-                    register_command(cmd_name, config[0], config[1])
-                else:
-                    register_command(cmd_name, config[0], config[1], config[2])
+        for cmd_name, module_path, object_name, is_module in _BUILTIN_COMMANDS:
+            if cmd_name in entry_map and cmd_name not in _CRITICAL_COMMANDS:
+                register_command(cmd_name, module_path, object_name, is_module)
         
         # Register additional commands that aren't in entry points
         if 'preflight' not in entry_map:
@@ -209,21 +224,9 @@ def _import_builtin_commands():
     logger = logging.getLogger("file-analyzer")
     logger.warning("Using fallback command loader - entry points discovery failed")
     
-    # Define all commands to load - skip analyze as it's already loaded at this point
-    commands = [
-        ("test", "src.cli.test.hook", "app"),
-        ("validate", "src.cli.validate.main", "app"),
-        ("artifact", "src.cli.artifact.main", "app"),
-        ("preflight", "src.cli.artifact.preflight", "app"),
-        ("adapter", "src.cli.artifact.adapter", None, True),  # Import as module
-        ("install", "src.cli.install.main", "app"),
-        ("model", "src.cli.model.main", "app"),
-        ("benchmark", "src.cli.benchmark.main", "app"),
-    ]
-    
     # Double-check critical commands are loaded
     try:
-        registered_commands = [t.name for t in app.registered_typer_instances]
+        registered_commands = [group.name for group in app.registered_groups]
         
         if "analyze" not in registered_commands:
             logger.debug("Analyze command not loaded yet, loading manually")
@@ -237,22 +240,38 @@ def _import_builtin_commands():
     except Exception as e:
         logger.error(f"Failed to load critical commands in fallback loader: {e}")
     
-    # Register each command
-    for cmd in commands:
-        if len(cmd) == 3:
-            register_command(cmd[0], cmd[1], cmd[2])
-        else:
-            register_command(cmd[0], cmd[1], cmd[2], cmd[3])
+    # Register the remaining commands - the critical ones were handled above
+    for cmd_name, module_path, object_name, is_module in _BUILTIN_COMMANDS:
+        if cmd_name not in _CRITICAL_COMMANDS:
+            register_command(cmd_name, module_path, object_name, is_module)
+
+@lru_cache(maxsize=2)
+def _static_environment(fast: bool = False) -> Tuple[Tuple[str, str], ...]:
+    """
+    Environment details that cannot change while the process runs.
+    
+    Args:
+        fast: Report sys.platform instead of probing the OS via platform.platform()
+    """
+    return (
+        ("python_version", sys.version),
+        ("platform", sys.platform if fast else platform.platform()),
+        ("os_name", os.name),
+    )
 
 def capture_environment():
-    """Capture and return environment details."""
-    return {
-        "python_version": sys.version,
-        "platform": platform.platform(),
-        "os_name": os.name,
-        "user": os.getenv("USER", "unknown"),
-        "pwd": os.getcwd(),
-    }
+    """
+    Capture and return environment details.
+    
+    Setting FA_FAST_ENV=1 skips the OS probe behind the platform string,
+    e.g. for test runs where the detailed value is not needed.
+    """
+    fast = os.environ.get("FA_FAST_ENV", "").lower() in ("1", "true", "yes")
+    env_info = dict(_static_environment(fast))
+    # The environment and working directory can change, so read them each call
+    env_info["user"] = os.getenv("USER", "unknown")
+    env_info["pwd"] = os.getcwd()
+    return env_info
 
 
 @app.command()
@@ -343,7 +362,7 @@ def main(
     
     # Show available commands (only in debug mode)
     if verbose:
-        logger.debug(f"Registered subcommands: {[typer_instance.name for typer_instance in app.registered_typer_instances]}")
+        logger.debug(f"Registered subcommands: {[group.name for group in app.registered_groups]}")
     
     # If a file path is provided without a subcommand, use quick analysis
     if ctx.invoked_subcommand is None and file_path:
@@ -366,26 +366,45 @@ class PathGuard:
         import builtins
         builtins.open = self.original_open
         
+    @staticmethod
+    def check(path: Union[str, Path], stacklevel: int = 1) -> str:
+        """
+        Validate a write target without opening it.
+
+        Args:
+            path: Path that would be written
+            stacklevel: Stack frame to report as the caller (1 = direct caller)
+
+        Returns:
+            The absolute path, if it respects artifact discipline
+
+        Raises:
+            ValueError: If the path violates artifact discipline
+        """
+        # Get absolute path for validation
+        abs_path = os.path.abspath(path)
+
+        # Check if the path is valid
+        if not validate_artifact_path(abs_path):
+            # Get caller information for better error message
+            caller_frame = sys._getframe(stacklevel)
+            caller_info = f"{caller_frame.f_code.co_filename}:{caller_frame.f_lineno}"
+
+            # Provide detailed error message
+            raise ValueError(
+                f"ERROR: Non-canonical artifact path detected: {abs_path}\n"
+                f"All artifact files must be created in {ARTIFACTS_ROOT}\n"
+                f"Called from: {caller_info}\n"
+                f"Hint: Use get_canonical_artifact_path() to generate valid artifact paths"
+            )
+        return abs_path
+
     def _guarded_open(self, file, mode='r', *args, **kwargs):
         # Check if this is a write operation
         if self._enforce_validation and ('w' in mode or 'a' in mode or '+' in mode):
-            # Get absolute path for validation
-            abs_path = os.path.abspath(file)
-            
-            # Check if the path is valid
-            if not validate_artifact_path(abs_path):
-                # Get caller information for better error message
-                caller_frame = sys._getframe(1)
-                caller_info = f"{caller_frame.f_code.co_filename}:{caller_frame.f_lineno}"
-                
-                # Provide detailed error message
-                raise ValueError(
-                    f"ERROR: Non-canonical artifact path detected: {abs_path}\n"
-                    f"All artifact files must be created in {ARTIFACTS_ROOT}\n"
-                    f"Called from: {caller_info}\n"
-                    f"Hint: Use get_canonical_artifact_path() to generate valid artifact paths"
-                )
-                
+            # Report the code that called open(), not this wrapper
+            self.check(file, stacklevel=2)
+
         # If validation passes or it's a read operation, proceed with the original open
         return self.original_open(file, mode, *args, **kwargs)
 
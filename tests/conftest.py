@@ -0,0 +1,78 @@
+"""
+Shared pytest fixtures for the File Analyzer test suite.
+"""
+
+import os
+import sys
+import uuid
+from pathlib import Path
+
+import pytest
+
+# Make the project root importable once for every test module
+PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from src.core.artifact_guard import (
+    get_canonical_artifact_path,
+    setup_artifact_structure,
+    ARTIFACT_TYPES,
+)
+
+
+@pytest.fixture(scope="session")
+def artifact_structure():
+    """
+    Create the artifact directory structure and artifacts.env once per session.
+
+    Not autouse: only tests that work with artifact paths should write into
+    the repository's artifacts/ directory.
+    """
+    setup_artifact_structure()
+
+
+@pytest.fixture(scope="session")
+def canonical_path_factory(artifact_structure):
+    """
+    Create canonical artifact directories, at most once per (type, context).
+
+    Each call to get_canonical_artifact_path creates a directory and writes a
+    manifest, so tests asking for the same type and context share one directory
+    for the whole session.
+    """
+    cache = {}
+
+    def make(artifact_type: str, context: str) -> str:
+        key = (artifact_type, context)
+        if key not in cache:
+            cache[key] = get_canonical_artifact_path(artifact_type, context)
+        return cache[key]
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def shared_artifact_dir(canonical_path_factory):
+    """One canonical test artifact directory shared by the whole session."""
+    return canonical_path_factory("test", "shared_suite")
+
+
+@pytest.fixture
+def artifact_dir(shared_artifact_dir):
+    """
+    A fresh directory inside the shared canonical artifact directory.
+
+    For tests that only need some valid artifact location and not a newly
+    generated canonical path.
+    """
+    path = os.path.join(shared_artifact_dir, uuid.uuid4().hex)
+    os.makedirs(path)
+    return path
+
+
+@pytest.fixture(params=ARTIFACT_TYPES)
+def artifact_type(request):
+    """Parametrize a test over every known artifact type."""
+    return request.param
+
@@ -0,0 +1,56 @@
+"""
+Tests for artifact config lookups in the artifact CLI.
+
+_get_config_value reads .artifact-config.json on every lookup; these tests
+check it never reports a stale value or fails on a missing or broken file.
+"""
+
+import os
+
+from src.cli.artifact.main import _get_config_value
+
+
+def test_missing_config_returns_default(tmp_path):
+    """Test a config file that does not exist yields the default."""
+    config_file = tmp_path / ".artifact-config.json"
+    assert _get_config_value(str(config_file), "retention_days", 7) == 7
+
+
+def test_invalid_json_returns_default(tmp_path):
+    """Test a config file that is not valid JSON yields the default."""
+    config_file = tmp_path / ".artifact-config.json"
+    config_file.write_text("{not json")
+    assert _get_config_value(str(config_file), "retention_days", 7) == 7
+
+
+def test_missing_key_returns_default(tmp_path):
+    """Test a valid config without the key yields the default."""
+    config_file = tmp_path / ".artifact-config.json"
+    config_file.write_text('{"other": 1}')
+    assert _get_config_value(str(config_file), "retention_days", 7) == 7
+
+
+def test_rewritten_config_is_reread(tmp_path):
+    """Test rewriting the config with different-size content returns the new value."""
+    config_file = tmp_path / ".artifact-config.json"
+    config_file.write_text('{"retention_days": 3}')
+    assert _get_config_value(str(config_file), "retention_days", 7) == 3
+    mtime_ns = os.stat(config_file).st_mtime_ns
+
+    # Simulate a coarse-timestamp filesystem: same mtime, different content
+    config_file.write_text('{"retention_days": 14}')
+    os.utime(config_file, ns=(mtime_ns, mtime_ns))
+    assert _get_config_value(str(config_file), "retention_days", 7) == 14
+
+
+def test_same_size_rewrite_is_reread(tmp_path):
+    """Test rewriting the config with same-size content and mtime returns the new value."""
+    config_file = tmp_path / ".artifact-config.json"
+    config_file.write_text('{"retention_days": 3}')
+    assert _get_config_value(str(config_file), "retention_days", 7) == 3
+    mtime_ns = os.stat(config_file).st_mtime_ns
+
+    # Same length, same mtime: nothing but the content tells the versions apart
+    config_file.write_text('{"retention_days": 5}')
+    os.utime(config_file, ns=(mtime_ns, mtime_ns))
+    assert _get_config_value(str(config_file), "retention_days", 7) == 5
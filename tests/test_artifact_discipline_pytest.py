@@ -7,16 +7,10 @@ correctly and can fully replace the bash implementation.
 """
 
 import os
-import sys
 import tempfile
 import pytest
 from pathlib import Path
 
-# Add the project root to the Python path
-project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
-
 # Import artifact discipline components
 from src.core.artifact_guard import (
     get_canonical_artifact_path, 
@@ -27,42 +21,88 @@ from src.core.artifact_guard import (
     safe_write,
     enforce_path_discipline,
     ARTIFACT_TYPES,
-    ARTIFACTS_ROOT
+    ARTIFACTS_ROOT,
+    PROJECT_ROOT,
+)
+
+# System temp directory, resolved once instead of in every invalid-path test
+_TMPDIR = tempfile.gettempdir()
+
+# Per-type artifact contexts, formatted once at import
+_CTX_BASIC = {t: f"pytest_{t}" for t in ARTIFACT_TYPES}
+_CTX_VALID = {t: f"pytest_valid_{t}" for t in ARTIFACT_TYPES}
+
+# Path fragments used by the validation tests, built once at import
+_SYSTEM_DIRS = ("/dev", "/proc", "/sys", "/var", "/etc", "/usr", "/lib", "/opt", "/bin")
+_LEGACY_PATTERNS = ("test_output", "analysis_results", "fastvlm_test")
+_STRUCTURE_DIRS = ("src", "tools", "tests")
+_ROOT_FILES = ("README.md", "setup.py", "requirements.txt")
+
+# Paths that must never validate, built once at import rather than per test run,
+# each with a stable test id that does not embed machine-specific paths
+_INVALID_PATH_CASES = (
+    # System temporary directories
+    ("tmp", "/tmp/test.txt"),
+    ("var-tmp", "/var/tmp/test.txt"),
+    ("system-tempdir", os.path.join(_TMPDIR, "test.txt")),
+    # Random outside path
+    ("home", os.path.join(os.path.expanduser("~"), "some_random_file.txt")),
+    # System directories (always POSIX absolute paths, so no os.path.join needed)
+    *(
+        (f"system-{system_dir.lstrip('/')}", f"{system_dir}/test.txt")
+        for system_dir in _SYSTEM_DIRS
+    ),
+    # Legacy artifact patterns
+    *(
+        (f"project-legacy-{legacy_pattern.replace('_', '-')}",
+         os.path.join(PROJECT_ROOT, f"{legacy_pattern}_1234"))
+        for legacy_pattern in _LEGACY_PATTERNS
+    ),
 )
 
+# Invalid path -> test id. A path listed twice keeps its first id: on Linux the
+# system temp directory is /tmp, which would otherwise yield the same case twice.
+_INVALID_PATHS = {}
+for _label, _path in _INVALID_PATH_CASES:
+    _INVALID_PATHS.setdefault(_path, _label)
+
+
+@enforce_path_discipline
+def _noop_sink(output_path, content=None):
+    """Decorated stand-in for a writer: exercises the path check without any file I/O."""
+    return output_path
+
+
 class TestCanonicalPathCreation:
     """Test creating and validating canonical artifact paths."""
     
-    def test_canonical_path_creation(self):
-        """Test basic canonical path creation."""
-        # Create a canonical artifact path for each artifact type
-        for artifact_type in ARTIFACT_TYPES:
-            path = get_canonical_artifact_path(artifact_type, f"pytest_{artifact_type}")
-            assert os.path.exists(path), f"Path {path} should exist"
-            assert os.path.isdir(path), f"Path {path} should be a directory"
-            assert validate_artifact_path(path), f"Path {path} should be valid"
-            
-            # Check manifest file exists
-            manifest_path = os.path.join(path, "manifest.json")
-            assert os.path.exists(manifest_path), f"Manifest {manifest_path} should exist"
-            
-            # Create a file in the canonical path
-            test_file = os.path.join(path, "test.txt")
-            with open(test_file, "w") as f:
-                f.write(f"Test content for {artifact_type}")
-            assert validate_artifact_path(test_file), f"File path {test_file} should be valid"
+    def test_canonical_path_creation(self, canonical_path_factory, artifact_type):
+        """Test basic canonical path creation for each artifact type."""
+        path = canonical_path_factory(artifact_type, _CTX_BASIC[artifact_type])
+        assert os.path.isdir(path), f"Path {path} should be an existing directory"
+        assert validate_artifact_path(path), f"Path {path} should be valid"
+        
+        # The manifest was just written by get_canonical_artifact_path, so one
+        # listing of the new directory is enough to confirm it is there
+        assert "manifest.json" in os.listdir(path), f"Manifest should exist in {path}"
+        
+        # Create a file in the canonical path
+        test_file = os.path.join(path, "test.txt")
+        Path(test_file).write_text(f"Test content for {artifact_type}")
+        assert validate_artifact_path(test_file), f"File path {test_file} should be valid"
     
     def test_invalid_artifact_type(self):
         """Test creating a path with an invalid artifact type."""
         with pytest.raises(ValueError):
             get_canonical_artifact_path("invalid_type", "test_context")
     
-    def test_canonical_path_format(self):
+    def test_canonical_path_format(self, canonical_path_factory):
         """Test that canonical paths follow the expected format."""
-        path = get_canonical_artifact_path("test", "pytest_format")
+        path = canonical_path_factory("test", "pytest_format")
         
-        # Path should be in artifacts/test/
-        assert path.startswith(os.path.join(ARTIFACTS_ROOT, "test")), "Path should be in artifacts/test/"
+        # Path should be in artifacts/test/ (commonpath rejects siblings like artifacts/test_backup)
+        test_root = os.path.normpath(os.path.join(ARTIFACTS_ROOT, "test"))
+        assert os.path.commonpath([os.path.normpath(path), test_root]) == test_root, "Path should be in artifacts/test/"
         
         # Path should contain the context
         assert "pytest_format" in path, "Path should contain the context"
@@ -80,59 +120,39 @@ class TestCanonicalPathCreation:
 class TestPathValidation:
     """Test path validation against canonical structure."""
     
-    def test_valid_paths(self):
-        """Test validation of valid paths."""
-        # Canonical artifact paths
-        for artifact_type in ARTIFACT_TYPES:
-            path = get_canonical_artifact_path(artifact_type, f"pytest_valid_{artifact_type}")
-            assert validate_artifact_path(path)
-            
-            # File in canonical path
-            file_path = os.path.join(path, f"valid_{artifact_type}.txt")
-            with open(file_path, "w") as f:
-                f.write(f"Valid {artifact_type} content")
-            assert validate_artifact_path(file_path)
-            
+    def test_valid_artifact_paths(self, canonical_path_factory, artifact_type):
+        """Test validation of canonical artifact paths for each artifact type."""
+        path = canonical_path_factory(artifact_type, _CTX_VALID[artifact_type])
+        
+        # A file inside the canonical directory validates only if the directory
+        # itself lies under the artifacts root, so one check covers both
+        file_path = os.path.join(path, f"valid_{artifact_type}.txt")
+        Path(file_path).write_text(f"Valid {artifact_type} content")
+        assert validate_artifact_path(file_path), f"File path {file_path} should be valid"
+    
+    def test_valid_project_paths(self):
+        """Test validation of project structure paths and root files."""
         # Project structure paths should be valid
-        for structure_dir in ["src", "tools", "tests"]:
-            path = os.path.join(project_root, structure_dir)
+        for structure_dir in _STRUCTURE_DIRS:
+            path = os.path.join(PROJECT_ROOT, structure_dir)
             assert validate_artifact_path(path), f"Project structure path {structure_dir} should be valid"
             
         # Root directory files should be valid
-        for root_file in ["README.md", "setup.py", "requirements.txt"]:
-            file_path = os.path.join(project_root, root_file)
+        for root_file in _ROOT_FILES:
+            file_path = os.path.join(PROJECT_ROOT, root_file)
             assert validate_artifact_path(file_path), f"Project root file {root_file} should be valid"
     
-    def test_invalid_paths(self):
+    @pytest.mark.parametrize("invalid_path", list(_INVALID_PATHS), ids=list(_INVALID_PATHS.values()))
+    def test_invalid_paths(self, invalid_path):
         """Test validation of invalid paths."""
-        # System temporary directories
-        assert not validate_artifact_path("/tmp/test.txt")
-        assert not validate_artifact_path("/var/tmp/test.txt")
-        assert not validate_artifact_path(os.path.join(tempfile.gettempdir(), "test.txt"))
-        
-        # System directories
-        for system_dir in ["/dev", "/proc", "/sys", "/var", "/etc", "/usr", "/lib", "/opt", "/bin"]:
-            path = os.path.join(system_dir, "test.txt")
-            assert not validate_artifact_path(path)
-            
-        # Legacy artifact patterns
-        for legacy_pattern in ["test_output", "analysis_results", "fastvlm_test"]:
-            path = os.path.join(project_root, f"{legacy_pattern}_1234")
-            assert not validate_artifact_path(path)
-            
-        # Random outside path
-        path = os.path.join(os.path.expanduser("~"), "some_random_file.txt")
-        assert not validate_artifact_path(path)
+        assert not validate_artifact_path(invalid_path), f"Invalid path {invalid_path} should be rejected"
 
 
 class TestPathGuard:
     """Test the PathGuard context manager."""
     
-    def test_path_guard_allows_valid_paths(self):
+    def test_path_guard_allows_valid_paths(self, artifact_dir):
         """Test that PathGuard allows operations on valid paths."""
-        # Create a canonical artifact path
-        artifact_dir = get_canonical_artifact_path("test", "pytest_pathguard")
-        
         # Use PathGuard to enforce artifact discipline
         with PathGuard(artifact_dir):
             # Valid file path - this should work
@@ -152,41 +172,37 @@ class TestPathGuard:
                 f.write("Valid subfile content")
             assert os.path.exists(valid_subfile)
     
-    def test_path_guard_prevents_invalid_paths(self):
+    def test_path_guard_prevents_invalid_paths(self, artifact_dir):
         """Test that PathGuard prevents operations on invalid paths."""
-        # Create a canonical artifact path
-        artifact_dir = get_canonical_artifact_path("test", "pytest_pathguard_invalid")
-        
         # Use PathGuard to enforce artifact discipline
         with PathGuard(artifact_dir):
-            # System temp directory - this should fail
+            # System temp directory - the intercepted open() should fail
             with pytest.raises(ValueError):
-                invalid_path = os.path.join(tempfile.gettempdir(), "invalid_file.txt")
+                invalid_path = os.path.join(_TMPDIR, "invalid_file.txt")
                 with open(invalid_path, "w") as f:
                     f.write("This should fail")
             
-            # Path outside artifacts - this should fail
-            with pytest.raises(ValueError):
-                invalid_path = os.path.join(os.path.expanduser("~"), "invalid_file.txt")
-                with open(invalid_path, "w") as f:
-                    f.write("This should fail")
-            
-            # Legacy pattern in project root - this should fail
-            with pytest.raises(ValueError):
-                invalid_path = os.path.join(project_root, "test_output_123", "invalid_file.txt")
-                os.makedirs(os.path.dirname(invalid_path), exist_ok=True)
-                with open(invalid_path, "w") as f:
-                    f.write("This should fail")
+        # The remaining cases only need the validation outcome, not a real open()
+        # Path outside artifacts - this should fail
+        with pytest.raises(ValueError):
+            PathGuard.check(os.path.join(os.path.expanduser("~"), "invalid_file.txt"))
+        
+        # Legacy pattern in project root - this should fail
+        with pytest.raises(ValueError):
+            PathGuard.check(os.path.join(PROJECT_ROOT, "test_output_123", "invalid_file.txt"))
+    
+    def test_path_guard_check_allows_valid_paths(self, artifact_dir):
+        """Test that PathGuard.check returns the absolute path for valid targets."""
+        valid_path = os.path.join(artifact_dir, "checked_file.txt")
+        assert PathGuard.check(valid_path) == os.path.abspath(valid_path)
+        assert not os.path.exists(valid_path)
 
 
 class TestSafeFunctions:
     """Test the safe_* functions."""
     
-    def test_safe_mkdir(self):
+    def test_safe_mkdir(self, artifact_dir):
         """Test safe_mkdir function."""
-        # Create a canonical artifact path
-        artifact_dir = get_canonical_artifact_path("test", "pytest_safe_mkdir")
-        
         # Use safe_mkdir to create a subdirectory
         subdir = os.path.join(artifact_dir, "subdir")
         result = safe_mkdir(subdir)
@@ -200,101 +216,73 @@ class TestSafeFunctions:
         
         # Try to create directory in invalid location
         with pytest.raises(ValueError):
-            invalid_dir = os.path.join(tempfile.gettempdir(), "invalid_dir")
+            invalid_dir = os.path.join(_TMPDIR, "invalid_dir")
             safe_mkdir(invalid_dir)
     
-    def test_safe_write(self):
+    def test_safe_write(self, artifact_dir):
         """Test safe_write function."""
-        # Create a canonical artifact path
-        artifact_dir = get_canonical_artifact_path("test", "pytest_safe_write")
-        
         # Use safe_write to write a file
         file_path = os.path.join(artifact_dir, "safe_write.txt")
         result = safe_write(file_path, "Safe write content")
         assert result == file_path
         assert os.path.exists(file_path)
-        with open(file_path, "r") as f:
-            assert f.read() == "Safe write content"
+        assert Path(file_path).read_text() == "Safe write content"
         
         # Try to write to invalid location
         with pytest.raises(ValueError):
-            invalid_path = os.path.join(tempfile.gettempdir(), "invalid_safe_write.txt")
+            invalid_path = os.path.join(_TMPDIR, "invalid_safe_write.txt")
             safe_write(invalid_path, "This should fail")
     
-    def test_safe_copy(self):
+    def test_safe_copy(self, artifact_dir):
         """Test safe_copy function."""
-        # Create a canonical artifact path
-        artifact_dir = get_canonical_artifact_path("test", "pytest_safe_copy")
-        
         # Create a source file
         source_path = os.path.join(artifact_dir, "source.txt")
-        with open(source_path, "w") as f:
-            f.write("Source content")
+        Path(source_path).write_text("Source content")
         
         # Use safe_copy to copy the file
         dest_path = os.path.join(artifact_dir, "dest.txt")
         result = safe_copy(source_path, dest_path)
         assert result == dest_path
         assert os.path.exists(dest_path)
-        with open(dest_path, "r") as f:
-            assert f.read() == "Source content"
+        assert Path(dest_path).read_text() == "Source content"
         
         # Try to copy to invalid location
         with pytest.raises(ValueError):
-            invalid_path = os.path.join(tempfile.gettempdir(), "invalid_safe_copy.txt")
+            invalid_path = os.path.join(_TMPDIR, "invalid_safe_copy.txt")
             safe_copy(source_path, invalid_path)
 
 
 class TestEnforcePathDisciplineDecorator:
     """Test the @enforce_path_discipline decorator."""
     
-    @enforce_path_discipline
-    def _decorated_write_function(self, output_path, content):
-        """Custom function with path discipline enforcement via decorator."""
-        with open(output_path, "w") as f:
-            f.write(content)
-        return output_path
-    
-    def test_decorator_allows_valid_paths(self):
-        """Test that the decorator allows operations on valid paths."""
-        # Create a canonical artifact path
-        artifact_dir = get_canonical_artifact_path("test", "pytest_decorator")
-        
+    def test_decorator_allows_valid_paths(self, shared_artifact_dir):
+        """Test that the decorator allows calls with valid paths."""
         # Use the decorated function with a valid path
-        valid_path = os.path.join(artifact_dir, "decorated_valid.txt")
-        result = self._decorated_write_function(valid_path, "Decorator test content")
-        assert result == valid_path
-        assert os.path.exists(valid_path)
-        with open(valid_path, "r") as f:
-            assert f.read() == "Decorator test content"
+        valid_path = os.path.join(shared_artifact_dir, "decorated_valid.txt")
+        assert _noop_sink(valid_path, "Decorator test content") == valid_path
     
     def test_decorator_prevents_invalid_paths(self):
-        """Test that the decorator prevents operations on invalid paths."""
+        """Test that the decorator prevents calls with invalid paths."""
         # Try to use the decorated function with an invalid path
         with pytest.raises(ValueError):
-            invalid_path = os.path.join(tempfile.gettempdir(), "decorated_invalid.txt")
-            self._decorated_write_function(invalid_path, "This should fail")
+            invalid_path = os.path.join(_TMPDIR, "decorated_invalid.txt")
+            _noop_sink(invalid_path, "This should fail")
 
 
 class TestCleanupArtifacts:
     """Test artifact cleanup functionality."""
     
-    def test_cleanup_setup(self):
-        """Test setting up the artifact structure."""
-        from src.core.artifact_guard import setup_artifact_structure, cleanup_artifacts
-        
-        # Setup artifact structure
-        setup_artifact_structure()
-        
-        # Check that the directories exist
-        assert os.path.exists(ARTIFACTS_ROOT)
+    def test_cleanup_setup(self, artifact_structure):
+        """Test the artifact structure set up by the session fixture."""
+        # Check that the directories exist, using one scan of the artifacts root
+        with os.scandir(ARTIFACTS_ROOT) as it:
+            entries = {entry.name: entry for entry in it}
         for artifact_type in ARTIFACT_TYPES:
-            type_dir = os.path.join(ARTIFACTS_ROOT, artifact_type)
-            assert os.path.exists(type_dir)
-            assert os.path.isdir(type_dir)
+            entry = entries.get(artifact_type)
+            assert entry is not None and entry.is_dir(), f"Missing artifact type directory: {artifact_type}"
         
         # Check that artifacts.env exists
-        env_file = os.path.join(project_root, "artifacts.env")
+        env_file = os.path.join(PROJECT_ROOT, "artifacts.env")
         assert os.path.exists(env_file)
 
 
@@ -5,10 +5,7 @@ High-value tests that actually test real functionality with minimal mocking.
 Focuses on the core business logic that users depend on.
 """
 
-import os
 import json
-import tempfile
-from pathlib import Path
 from unittest.mock import patch, MagicMock
 import pytest
 
@@ -9,11 +9,7 @@ verifying all artifact path discipline is enforced and used correctly.
 import os
 import sys
 import unittest
-import tempfile
 import subprocess
-import json
-import shutil
-from pathlib import Path
 
 # Add the project root to the path for imports
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
@@ -23,10 +19,7 @@ if project_root not in sys.path:
 # Import artifact discipline components
 from src.core.artifact_guard import (
     get_canonical_artifact_path,
-    validate_artifact_path,
-    PathGuard,
     cleanup_artifacts,
-    ARTIFACTS_ROOT
 )
 
 # Import the main analyzer
@@ -87,7 +80,6 @@ class TestEndToEnd(unittest.TestCase):
     def test_analyze_sh_wrapper(self):
         """Test the analyze.sh wrapper script."""
         # Skip this test for now - shell script execution is environment-dependent
-        import unittest
         self.skipTest("Skipping shell script execution test - environment dependent")
         
     def test_artifact_discipline_in_subdir(self):
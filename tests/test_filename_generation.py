@@ -9,7 +9,6 @@ Tests all aspects of the filename generation logic including:
 - Integration with FastVLM adapter
 """
 
-import os
 import pytest
 import tempfile
 from unittest.mock import patch, MagicMock
@@ -8,12 +8,8 @@ extracting, validating, and processing JSON from model outputs.
 
 import os
 import sys
-import json
-import time
 import unittest
-from unittest.mock import patch, MagicMock, mock_open
-
-import pytest
+from unittest.mock import patch
 
 # Add the project root to the path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -12,9 +12,7 @@ This module tests the CLI interface for model management commands, ensuring:
 import os
 import sys
 import tempfile
-import shutil
 import hashlib
-from pathlib import Path
 from unittest.mock import patch, MagicMock, mock_open
 
 import pytest
@@ -14,7 +14,7 @@ if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
 # Import from the new module structure
-from src.core.vision import VisionAnalyzer, DEFAULT_VISION_CONFIG, VISION_MODELS
+from src.core.vision import VisionAnalyzer, DEFAULT_VISION_CONFIG
 VISION_AVAILABLE = True
 
 def test_vision_analyzer():
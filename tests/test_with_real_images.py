@@ -5,7 +5,6 @@ This ensures both local and remote image sources are tested.
 """
 
 import os
-import sys
 import tempfile
 
 # Try to import benchmark functions